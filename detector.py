@@ -1,6 +1,9 @@
 import mss
 from ultralytics import YOLO
-from threading import Lock
+from threading import Condition
+from collections import deque
+from typing import NamedTuple
+import time
 import cv2
 import numpy as np
 
@@ -58,14 +61,105 @@ ZONE_DEFINITIONS = [
     {"name": "Red Nexus", "coords": (0.93, 0.07), "radius": 0.04},
 ]
 MINIMAP_SCALE = 0.25
+FRAME_HISTORY_SIZE = 64
+
+DETECTION_DTYPE = np.dtype([
+    ("class_id", "i2"),
+    ("conf", "f4"),
+    ("x", "f4"),  # normalized box center
+    ("y", "f4"),
+    ("capture_time", "f8"),
+])
+EMPTY_DETECTIONS = np.zeros(0, dtype=DETECTION_DTYPE)
+EMPTY_DETECTIONS.flags.writeable = False
+
+
+def results_to_records(results, capture_time):
+    """Copies the class/conf/xywhn tensors of all YOLO results into one read-only record array."""
+    chunks = []
+    for r in results:
+        boxes = r.boxes
+        if len(boxes) == 0:
+            continue
+        xywhn = boxes.xywhn.cpu().numpy()
+        records = np.empty(len(boxes), dtype=DETECTION_DTYPE)
+        records["class_id"] = boxes.cls.cpu().numpy()
+        records["conf"] = boxes.conf.cpu().numpy()
+        records["x"] = xywhn[:, 0]
+        records["y"] = xywhn[:, 1]
+        records["capture_time"] = capture_time
+        chunks.append(records)
+    if not chunks:
+        return EMPTY_DETECTIONS
+    detections = np.concatenate(chunks) if len(chunks) > 1 else chunks[0]
+    detections.flags.writeable = False
+    return detections
+
+
+class DetectionFrame(NamedTuple):
+    version: int
+    capture_time: float  # time.monotonic() right after the screen grab
+    inference_time: float  # time.monotonic() after the model returned
+    detections: np.ndarray  # read-only DETECTION_DTYPE records
+
+
+class DetectionBuffer:
+    """
+    Double buffer of immutable DetectionFrames.
+    The writer fills the back slot and then flips the front index, so latest() is a plain
+    attribute read without locking. The condition is only used to wake wait_newer() callers.
+    """
+    def __init__(self, history_size=FRAME_HISTORY_SIZE):
+        empty = DetectionFrame(0, 0.0, 0.0, EMPTY_DETECTIONS)
+        self._slots = [empty, empty]
+        self._front = 0
+        self._history = deque(maxlen=history_size)
+        self._new_frame = Condition()
+
+    def publish(self, capture_time, inference_time, detections):
+        back = 1 - self._front
+        frame = DetectionFrame(self._slots[self._front].version + 1, capture_time, inference_time, detections)
+        self._slots[back] = frame
+        self._front = back
+        self._history.append(frame)
+        with self._new_frame:
+            self._new_frame.notify_all()
+        return frame
+
+    def latest(self):
+        return self._slots[self._front]
+
+    def wait_newer(self, version, timeout=None):
+        """Blocks until a frame newer than `version` is published. Returns None on timeout."""
+        frame = self.latest()
+        if frame.version > version:
+            return frame
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._new_frame:
+            while self.latest().version <= version:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return None
+                self._new_frame.wait(remaining)
+        return self.latest()
+
+    def history(self):
+        return list(self._history)
+
+    def nearest(self, timestamp):
+        """Returns the recent frame whose capture time is closest to `timestamp`."""
+        frames = self.history()
+        if not frames:
+            return None
+        return min(frames, key=lambda f: abs(f.capture_time - timestamp))
+
 
 class MinimapDetector:
     def __init__(self, model_path, show_preview=True):
         self.model = YOLO(model_path)
         self.show_preview = show_preview
         self.running = False
-        self.detected_objects = []
-        self.lock = Lock()
+        self.frames = DetectionBuffer()
         with mss.mss() as sct:
             monitor = sct.monitors[1]
             roi_height = int(monitor["height"] * MINIMAP_SCALE)
@@ -80,18 +174,12 @@ class MinimapDetector:
         with mss.mss() as sct:
             while self.running:
                 sct_img = sct.grab(self.minimap_roi)
+                capture_time = time.monotonic()
                 frame = np.array(sct_img)
                 frame_bgr = cv2.cvtColor(frame, cv2.COLOR_BGRA2BGR)
                 results = self.model(frame_bgr, conf=conf_threshold, verbose=False)
-                current_detections = []
-                for r in results:
-                    for box in r.boxes:
-                        class_id = int(box.cls[0])
-                        class_name = self.model.names[class_id]
-                        x_norm, y_norm, _, _ = box.xywhn[0].tolist()
-                        current_detections.append({"tag": class_name, "x_norm": x_norm, "y_norm": y_norm})
-                with self.lock:
-                    self.detected_objects = current_detections
+                inference_time = time.monotonic()
+                self.frames.publish(capture_time, inference_time, results_to_records(results, capture_time))
                 if self.show_preview:
                     annotated_frame = results[0].plot()
                     h, w, _ = annotated_frame.shape
@@ -117,8 +205,9 @@ class MinimapDetector:
         print("minimap detection thread stopped")
 
     def get_detected_objects(self):
-        with self.lock:
-            return list(self.detected_objects)
+        detections = self.frames.latest().detections
+        return [{"tag": self.model.names[int(class_id)], "x_norm": float(x), "y_norm": float(y)}
+                for class_id, x, y in zip(detections["class_id"], detections["x"], detections["y"])]
 
     def stop(self):
         self.running = False
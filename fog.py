@@ -0,0 +1,119 @@
+import hashlib
+import numpy as np
+import cv2
+from pathlib import Path
+
+GRID_SIZE = 64
+MAP_SIZE_UNITS = 14870  # Summoner's Rift width in game units
+CHAMPION_MOVE_SPEED = 345  # average base move speed in game units per second
+FOG_TOP_ZONES = 3
+FOG_DISTANCE_SCALE = 0.1  # normalized walking distance over which a zone's weight drops by 1/e
+FOG_HORIZON_TICKS = 6  # polling ticks an unseen champion keeps an estimate for
+DISTANCE_FIELD_CACHE = Path("distance_field.npz")
+WALKABLE_MASK_PATH = Path("walkable_mask.png")  # optional, white = walkable
+
+
+def mask_fingerprint(mask_path):
+    """Identifies the walkable mask a distance field was built from ("none" when there is no mask)."""
+    if not Path(mask_path).exists():
+        return "none"
+    return hashlib.sha1(Path(mask_path).read_bytes()).hexdigest()
+
+
+def load_walkable_mask(mask_path, grid_size):
+    if not Path(mask_path).exists():
+        return np.ones((grid_size, grid_size), dtype=bool)
+    mask = cv2.imread(str(mask_path), cv2.IMREAD_GRAYSCALE)
+    mask = cv2.resize(mask, (grid_size, grid_size), interpolation=cv2.INTER_AREA)
+    return mask > 127
+
+
+def compute_distance_fields(zone_definitions, walkable):
+    """
+    Returns an array of shape (zones, grid, grid) with the walking distance (normalized
+    minimap units) from every zone center to every cell, using 8-connected moves.
+    All zones are relaxed together with shifted-array minimums until nothing changes.
+    """
+    grid_size = walkable.shape[0]
+    step = 1.0 / grid_size
+    fields = np.full((len(zone_definitions), grid_size, grid_size), np.inf, dtype=np.float32)
+    for i, zone in enumerate(zone_definitions):
+        col = min(int(zone["coords"][0] * grid_size), grid_size - 1)
+        row = min(int(zone["coords"][1] * grid_size), grid_size - 1)
+        fields[i, row, col] = 0.0
+
+    moves = [(dy, dx, step * np.hypot(dy, dx)) for dy in (-1, 0, 1) for dx in (-1, 0, 1) if dy or dx]
+    padded = np.full((len(zone_definitions), grid_size + 2, grid_size + 2), np.inf, dtype=np.float32)
+    while True:
+        padded[:, 1:-1, 1:-1] = fields
+        relaxed = fields.copy()
+        for dy, dx, cost in moves:
+            neighbour = padded[:, 1 + dy:grid_size + 1 + dy, 1 + dx:grid_size + 1 + dx]
+            np.minimum(relaxed, neighbour + np.float32(cost), out=relaxed)
+        relaxed[:, ~walkable] = np.inf
+        relaxed = np.minimum(relaxed, fields)  # keep zone centers even if the mask marks them blocked
+        if np.array_equal(relaxed, fields):
+            return fields
+        fields = relaxed
+
+
+class FogEstimator:
+    """
+    Estimates which zones an unseen champion could have reached since it was last seen.
+    The per-zone distance fields are computed once and cached on disk, so an estimate for
+    every champion is a single column lookup into the field matrix.
+    """
+    def __init__(self, zone_definitions, grid_size=GRID_SIZE, cache_path=DISTANCE_FIELD_CACHE,
+                 mask_path=WALKABLE_MASK_PATH, move_speed=CHAMPION_MOVE_SPEED, horizon=60.0):
+        self.zone_names = [zone["name"] for zone in zone_definitions]
+        self.grid_size = grid_size
+        self.speed = move_speed / MAP_SIZE_UNITS  # normalized minimap units per second
+        self.horizon = horizon  # seconds after which a champion is no longer estimated
+        mask_id = mask_fingerprint(mask_path)
+        fields = self._load_cached(cache_path, mask_id)
+        if fields is None:
+            print("Computing minimap distance field (first run, or zones/mask changed)...")
+            fields = compute_distance_fields(zone_definitions, load_walkable_mask(mask_path, grid_size))
+            np.savez_compressed(cache_path, fields=fields, zones=np.array(self.zone_names), mask=np.array(mask_id))
+        # Distances are symmetric, so column `cell` holds the distance from that cell to every zone.
+        self.fields = fields.reshape(len(self.zone_names), -1)
+
+    def _load_cached(self, cache_path, mask_id):
+        if not Path(cache_path).exists():
+            return None
+        cached = np.load(cache_path)
+        if (cached["zones"].tolist() != self.zone_names or cached["fields"].shape[1] != self.grid_size
+                or "mask" not in cached or str(cached["mask"]) != mask_id):
+            return None
+        return cached["fields"]
+
+    def estimate(self, names, xs, ys, seen_at, game_time, top_n=FOG_TOP_ZONES):
+        """
+        `xs`/`ys`/`seen_at` are the last seen normalized position and game time of each champion in `names`.
+        Returns {champion: {zone: probability}} with the `top_n` most likely reachable zones.
+        Champions unseen for longer than the horizon are left out.
+        """
+        elapsed = game_time - np.asarray(seen_at, dtype=np.float64)
+        keep = np.flatnonzero(elapsed <= self.horizon)
+        if len(keep) == 0:
+            return {}
+        names = [names[i] for i in keep]
+        xs, ys, elapsed = np.asarray(xs)[keep], np.asarray(ys)[keep], elapsed[keep]
+        cols = np.clip((xs * self.grid_size).astype(np.intp), 0, self.grid_size - 1)
+        rows = np.clip((ys * self.grid_size).astype(np.intp), 0, self.grid_size - 1)
+        dist = self.fields[:, rows * self.grid_size + cols]  # (zones, champions)
+        reach = self.speed * np.maximum(elapsed, 0)
+
+        # Reachable zones are weighted by walking distance from the last seen position, so the
+        # ranking stays centred on it instead of flattening out as the reach covers the map.
+        weights = np.where(dist <= reach, np.exp(-dist / FOG_DISTANCE_SCALE), 0)
+        stuck = weights.sum(axis=0) == 0
+        weights[:, stuck] = (dist[:, stuck] == dist[:, stuck].min(axis=0)).astype(weights.dtype)
+        probabilities = weights / weights.sum(axis=0)
+
+        top_zones = np.argsort(-probabilities, axis=0)[:top_n]
+        estimates = {}
+        for j, name in enumerate(names):
+            estimates[name] = {self.zone_names[z]: round(float(probabilities[z, j]), 2)
+                               for z in top_zones[:, j] if probabilities[z, j] > 0}
+        return estimates
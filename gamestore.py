@@ -0,0 +1,283 @@
+import json
+import time
+import hashlib
+import numpy as np
+from pathlib import Path
+
+MAX_ITEM_SLOTS = 7
+GAME_RESUME_TOLERANCE = 120  # seconds of drift allowed between estimated start times of the same game
+TEAM_CODES = ["ORDER", "CHAOS"]
+ROLE_CODES = ["UNKNOWN", "TOP", "JUNGLE", "MID", "BOT", "SUPPORT"]
+
+# One row per player per tick.
+STATS_DTYPE = np.dtype([
+    ("game_time", "f4"),
+    ("player", "u1"),
+    ("team", "u1"),
+    ("level", "u1"),
+    ("kills", "u2"),
+    ("deaths", "u2"),
+    ("assists", "u2"),
+    ("role", "u1"),
+    ("items", "i4", (MAX_ITEM_SLOTS,)),
+])
+
+# One row per champion sighting. `exact` is False when x/y is a zone center (imported logs).
+POSITIONS_DTYPE = np.dtype([
+    ("game_time", "f4"),
+    ("player", "u1"),
+    ("zone", "i2"),
+    ("x", "f4"),
+    ("y", "f4"),
+    ("exact", "?"),
+])
+
+STATS_FILE = "stats.bin"
+POSITIONS_FILE = "positions.bin"
+META_FILE = "meta.json"
+
+
+def _open_columns(path, dtype):
+    if not path.exists() or path.stat().st_size < dtype.itemsize:
+        return np.empty(0, dtype=dtype)
+    count = path.stat().st_size // dtype.itemsize
+    return np.memmap(path, dtype=dtype, mode="r", shape=(count,))
+
+
+def players_fingerprint(players):
+    pairs = sorted((p.get('summonerName') or "", p.get('championName') or "") for p in players)
+    return hashlib.sha1(json.dumps(pairs, ensure_ascii=False).encode("utf-8")).hexdigest()[:12]
+
+
+def _zone_index(zone_names, location):
+    name = location.removeprefix("last seen ").removeprefix("near ")
+    try:
+        return zone_names.index(name)
+    except ValueError:
+        return -1
+
+
+class GameRecorder:
+    """
+    Appends per-tick player stats and minimap positions of a single game to
+    fixed-width binary column files that GameRecording can memory-map.
+    """
+    def __init__(self, game_dir, players, zone_names, started_at=None):
+        self.game_dir = Path(game_dir)
+        self.game_dir.mkdir(parents=True, exist_ok=True)
+        self.zone_names = list(zone_names)
+        self.player_index = {p.get('summonerName'): i for i, p in enumerate(players)}
+        self.champion_index = {p.get('championName'): i for i, p in enumerate(players)}
+        meta = {
+            "players": [{"summonerName": p.get('summonerName'),
+                         "championName": p.get('championName'),
+                         "team": p.get('team')} for p in players],
+            "zones": self.zone_names,
+            "fingerprint": players_fingerprint(players),
+            "startedAt": started_at,
+        }
+        with open(self.game_dir / META_FILE, "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False, indent=4)
+
+    def record_tick(self, log_entry, player_slots, xs, ys, zone_ids, exact=True):
+        """
+        Appends one `prepare_log_entry` snapshot plus the sightings of this tick, given as
+        parallel arrays of player slots (index into `players`), positions and zone indices.
+        """
+        game_time = log_entry.get("gameTime", 0)
+        players = [p for p in log_entry.get("players", []) if p.get("summonerName") in self.player_index]
+        stats = np.zeros(len(players), dtype=STATS_DTYPE)
+        for row, p in zip(stats, players):
+            kills, deaths, assists = (int(v) for v in p.get("kda", "0/0/0").split("/"))
+            items = [i for i in p.get("items", []) if i is not None][:MAX_ITEM_SLOTS]
+            row["game_time"] = game_time
+            row["player"] = self.player_index[p["summonerName"]]
+            row["team"] = TEAM_CODES.index(p["team"]) if p.get("team") in TEAM_CODES else 0
+            row["level"] = p.get("level") or 0
+            row["kills"], row["deaths"], row["assists"] = kills, deaths, assists
+            role = p.get("inferredRole", "UNKNOWN")
+            row["role"] = ROLE_CODES.index(role) if role in ROLE_CODES else 0
+            row["items"][:len(items)] = items
+
+        positions = np.zeros(len(player_slots), dtype=POSITIONS_DTYPE)
+        positions["game_time"] = game_time
+        positions["player"] = player_slots
+        positions["zone"] = zone_ids
+        positions["x"], positions["y"] = xs, ys
+        positions["exact"] = exact
+
+        with open(self.game_dir / STATS_FILE, "ab") as f:
+            f.write(stats.tobytes())
+        with open(self.game_dir / POSITIONS_FILE, "ab") as f:
+            f.write(positions.tobytes())
+
+
+class GameRecording:
+    """
+    Read-only, memory-mapped view over one recorded game.
+    Rows are stored in game-time order, so time windows are resolved with a binary search.
+    """
+    def __init__(self, game_dir):
+        self.game_dir = Path(game_dir)
+        with open(self.game_dir / META_FILE, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        self.players = meta["players"]
+        self.zone_names = meta["zones"]
+        self.stats = _open_columns(self.game_dir / STATS_FILE, STATS_DTYPE)
+        self.positions = _open_columns(self.game_dir / POSITIONS_FILE, POSITIONS_DTYPE)
+
+    def player_id(self, name):
+        for i, p in enumerate(self.players):
+            if name in (p["summonerName"], p["championName"]):
+                return i
+        return None
+
+    def stat_series(self, name, field):
+        """Returns (game_time, values) of a stat column for a summoner or champion."""
+        player_id = self.player_id(name)
+        if player_id is None:
+            return np.empty(0, dtype="f4"), np.empty(0, dtype=STATS_DTYPE[field])
+        mask = self.stats["player"] == player_id
+        return np.asarray(self.stats["game_time"][mask]), np.asarray(self.stats[field][mask])
+
+    def team_totals_by_minute(self, field):
+        """
+        Returns an array of shape (minutes, 2) with the ORDER/CHAOS sum of `field`
+        taken at the last recorded tick of every minute. Minutes without any tick are NaN.
+        """
+        if len(self.stats) == 0:
+            return np.zeros((0, len(TEAM_CODES)))
+        game_time = np.asarray(self.stats["game_time"])
+        minute = (game_time // 60).astype(np.intp)
+        last_time = np.full(minute.max() + 1, -1.0, dtype="f4")
+        np.maximum.at(last_time, minute, game_time)
+        at_minute_end = game_time == last_time[minute]
+        totals = np.full((len(last_time), len(TEAM_CODES)), np.nan)
+        totals[last_time >= 0] = 0.0
+        np.add.at(totals, (minute[at_minute_end], self.stats["team"][at_minute_end]),
+                  self.stats[field][at_minute_end])
+        return totals
+
+    def positions_between(self, start_time, end_time, name=None):
+        """Returns the position rows with start_time <= game_time < end_time."""
+        game_time = self.positions["game_time"]
+        lo, hi = np.searchsorted(game_time, [start_time, end_time])
+        window = np.asarray(self.positions[lo:hi])
+        if name is not None:
+            window = window[window["player"] == self.player_id(name)]
+        return window
+
+
+class GameStore:
+    """A directory of recorded games, one sub-directory per game."""
+    def __init__(self, root="game_store"):
+        self.root = Path(root)
+
+    def games(self):
+        if not self.root.exists():
+            return []
+        return sorted(d.name for d in self.root.iterdir() if (d / META_FILE).exists())
+
+    def open(self, game_id):
+        return GameRecording(self.root / game_id)
+
+    def find_game(self, players, started_at):
+        """Returns the stored game with the same players that started at about `started_at`, if any."""
+        fingerprint = players_fingerprint(players)
+        for game_id in self.games():
+            with open(self.root / game_id / META_FILE, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            if (meta.get("fingerprint") == fingerprint and meta.get("startedAt") is not None
+                    and abs(meta["startedAt"] - started_at) <= GAME_RESUME_TOLERANCE):
+                return game_id
+        return None
+
+    def recorder(self, players, zone_names, game_time=0.0, game_id=None):
+        """
+        Opens a recorder for the game in progress. The Live Client API has no game ID, so a game is
+        identified by its players and its estimated wall-clock start; a reconnect to the same game
+        keeps appending to the same directory.
+        """
+        if game_id is not None:
+            if (self.root / game_id / STATS_FILE).exists():
+                raise FileExistsError(f"Game '{game_id}' is already recorded in '{self.root}'.")
+            return GameRecorder(self.root / game_id, players, zone_names)
+        started_at = time.time() - game_time
+        game_id = self.find_game(players, started_at)
+        if game_id is None:
+            game_id = f"{time.strftime('%Y%m%d_%H%M%S', time.localtime(started_at))}_{players_fingerprint(players)[:6]}"
+        return GameRecorder(self.root / game_id, players, zone_names, started_at)
+
+    def average_stat_by_minute(self, field, champion=None):
+        """
+        Averages `field` per game minute over every stored game, optionally restricted
+        to one champion. Games are memory-mapped one at a time.
+        """
+        sums = np.zeros(0)
+        counts = np.zeros(0)
+        for game_id in self.games():
+            recording = self.open(game_id)
+            stats = recording.stats
+            if champion is not None:
+                player_id = recording.player_id(champion)
+                if player_id is None:
+                    continue
+                stats = stats[stats["player"] == player_id]
+            if len(stats) == 0:
+                continue
+            minute = (np.asarray(stats["game_time"]) // 60).astype(np.intp)
+            game_sums = np.bincount(minute, weights=stats[field])
+            game_counts = np.bincount(minute)
+            if len(game_sums) > len(sums):
+                sums = np.pad(sums, (0, len(game_sums) - len(sums)))
+                counts = np.pad(counts, (0, len(game_counts) - len(counts)))
+            sums[:len(game_sums)] += game_sums
+            counts[:len(game_counts)] += game_counts
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(counts > 0, sums / np.maximum(counts, 1), np.nan)
+
+
+def import_game_log(log_path, store, zone_definitions, game_id=None):
+    """
+    Converts an existing `game_log.json` into a stored game.
+    Minimap positions in the log are zone labels, so they are stored at the zone center with exact=False.
+    The default game id is derived from the players and the first game time, so importing the same
+    game twice raises FileExistsError instead of appending duplicate rows.
+    """
+    log_path = Path(log_path)
+    with open(log_path, "r", encoding="utf-8") as f:
+        game_log = json.load(f)
+    entries = sorted(game_log.values(), key=lambda e: e.get("gameTime", 0))
+    if not entries:
+        return None
+
+    zone_centers = {zone["name"]: zone["coords"] for zone in zone_definitions}
+    players = entries[0].get("players", [])
+    game_id = game_id or f"import_{players_fingerprint(players)[:6]}_{int(entries[0].get('gameTime', 0))}"
+    recorder = store.recorder(players, list(zone_centers), game_id=game_id)
+    for entry in entries:
+        sightings = []
+        for obj in entry.get("detectedMinimapObjects", []):
+            location = obj.get("location", "")
+            if location.startswith("last seen") or location == "Unknown":
+                continue
+            zone_id = _zone_index(recorder.zone_names, location)
+            if zone_id >= 0 and obj.get("champion") in recorder.champion_index:
+                x_norm, y_norm = zone_centers[recorder.zone_names[zone_id]]
+                sightings.append((recorder.champion_index[obj["champion"]], x_norm, y_norm, zone_id))
+        slots, xs, ys, zone_ids = np.array(sightings, dtype=np.float64).reshape(-1, 4).T
+        recorder.record_tick(entry, slots.astype(np.intp), xs, ys, zone_ids.astype(np.intp), exact=False)
+    return game_id
+
+
+if __name__ == "__main__":
+    import sys
+    from zones import ZONE_DEFINITIONS
+
+    store = GameStore()
+    for path in sys.argv[1:]:
+        try:
+            imported = import_game_log(path, store, ZONE_DEFINITIONS)
+            print(f"✔ Imported '{path}' as game '{imported}'.")
+        except FileExistsError as e:
+            print(f"[Skipped] '{path}': {e}")
@@ -0,0 +1,90 @@
+import numpy as np
+from pathlib import Path
+
+GRID_SIZE = 64
+PRESENCE_HALF_LIFE = 90.0  # seconds of game time
+PRESENCE_TOP_ZONES = 3
+
+
+class OccupancyMap:
+    """
+    Per-champion occupancy grids over the normalized minimap.
+    Every update decays all grids by the elapsed game time and adds the new sightings,
+    so the grids always describe the last few minutes without keeping any history.
+    """
+    def __init__(self, champion_names, zone_definitions, grid_size=GRID_SIZE, half_life=PRESENCE_HALF_LIFE):
+        self.champion_names = list(champion_names)
+        self.zone_names = [zone["name"] for zone in zone_definitions]
+        self.grid_size = grid_size
+        self.half_life = half_life
+        self.grids = np.zeros((len(self.champion_names), grid_size, grid_size), dtype=np.float32)
+        self.game_time = 0.0
+
+        # Each cell belongs to its nearest zone, so a grid collapses to zone totals with one matmul.
+        centers = (np.arange(grid_size) + 0.5) / grid_size
+        cell_x, cell_y = np.meshgrid(centers, centers)
+        zone_coords = np.array([zone["coords"] for zone in zone_definitions], dtype=np.float32)
+        dist = np.hypot(cell_x.reshape(-1, 1) - zone_coords[:, 0], cell_y.reshape(-1, 1) - zone_coords[:, 1])
+        self.cell_zone = np.argmin(dist, axis=1)
+        self.zone_matrix = np.zeros((grid_size * grid_size, len(self.zone_names)), dtype=np.float32)
+        self.zone_matrix[np.arange(grid_size * grid_size), self.cell_zone] = 1.0
+
+    def update(self, game_time, champion_slots, xs, ys):
+        """
+        Decays the grids to `game_time` and adds one sighting per champion slot
+        (index into `champion_names`) at the normalized position xs/ys.
+        """
+        elapsed = game_time - self.game_time
+        if elapsed > 0:
+            self.grids *= np.float32(0.5 ** (elapsed / self.half_life))
+            self.game_time = game_time
+
+        if len(champion_slots) == 0:
+            return
+        cols = np.clip((np.asarray(xs) * self.grid_size).astype(np.intp), 0, self.grid_size - 1)
+        rows = np.clip((np.asarray(ys) * self.grid_size).astype(np.intp), 0, self.grid_size - 1)
+        np.add.at(self.grids, (np.asarray(champion_slots, dtype=np.intp), rows, cols), 1.0)
+
+    def zone_presence(self):
+        """Returns an array of shape (champions, zones) with each champion's share of recent presence per zone."""
+        totals = self.grids.reshape(len(self.champion_names), -1) @ self.zone_matrix
+        mass = totals.sum(axis=1, keepdims=True)
+        return np.divide(totals, mass, out=np.zeros_like(totals), where=mass > 0)
+
+    def summaries(self, top_n=PRESENCE_TOP_ZONES):
+        """Returns {champion: ["<zone> <share>%", ...]} for every champion seen recently."""
+        presence = self.zone_presence()
+        top_zones = np.argsort(-presence, axis=1)[:, :top_n]
+        summary = {}
+        for i, name in enumerate(self.champion_names):
+            if not name:
+                continue
+            zones = [f"{self.zone_names[z]} {presence[i, z] * 100:.0f}%" for z in top_zones[i] if presence[i, z] > 0]
+            if zones:
+                summary[name] = zones
+        return summary
+
+    def save(self, path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Empty slots are stored as "" so the names stay a plain string array (no pickling on load).
+        champions = np.array([name or "" for name in self.champion_names], dtype=str)
+        np.savez_compressed(path, grids=self.grids, champions=champions, game_time=np.float64(self.game_time))
+
+    @classmethod
+    def load(cls, path, zone_definitions):
+        snapshot = np.load(path)
+        champion_names = [name or None for name in snapshot["champions"].tolist()]
+        occupancy = cls(champion_names, zone_definitions, grid_size=snapshot["grids"].shape[1])
+        occupancy.grids = snapshot["grids"]
+        occupancy.game_time = float(snapshot["game_time"])
+        return occupancy
+
+    @classmethod
+    def restore(cls, path, champion_names, zone_definitions):
+        """Loads the snapshot at `path` when it belongs to the same champions, otherwise starts empty."""
+        if Path(path).exists():
+            occupancy = cls.load(path, zone_definitions)
+            if occupancy.champion_names == list(champion_names):
+                return occupancy
+        return cls(champion_names, zone_definitions)
@@ -9,62 +9,12 @@ import numpy as np
 from pathlib import Path
 import logging
 from notifier import GameEventNotifier
-from detector import MinimapDetector
-from tracker import PositionTracker
-
-ZONE_DEFINITIONS = [
-    #Objects
-    {"name": "Baron Pit", "coords": (0.355, 0.245), "radius": 0.06},
-    {"name": "Dragon Pit", "coords": (0.645, 0.755), "radius": 0.06},
-
-    #Jungle
-    {"name": "Blue Team's Blue Buff", "coords": (0.185, 0.65), "radius": 0.045},
-    {"name": "Blue Team's Red Buff", "coords": (0.37, 0.81), "radius": 0.045},
-    {"name": "Red Team's Blue Buff", "coords": (0.815, 0.35), "radius": 0.045},
-    {"name": "Red Team's Red Buff", "coords": (0.63, 0.19), "radius": 0.045},
-
-    #Blue Team
-    # Top Lane
-    {"name": "Blue Top T1 Tower", "coords": (0.09, 0.28), "radius": 0.035},
-    {"name": "Blue Top T2 Tower", "coords": (0.19, 0.47), "radius": 0.04},
-    {"name": "Blue Top T3 Tower", "coords": (0.16, 0.64), "radius": 0.04},
-    {"name": "Blue Top Inhibitor", "coords": (0.1, 0.71), "radius": 0.03},
-    # Mid Lane
-    {"name": "Blue Mid T1 Tower", "coords": (0.40, 0.60), "radius": 0.04},
-    {"name": "Blue Mid T2 Tower", "coords": (0.32, 0.68), "radius": 0.04},
-    {"name": "Blue Mid T3 Tower", "coords": (0.24, 0.76), "radius": 0.04},
-    {"name": "Blue Mid Inhibitor", "coords": (0.17, 0.81), "radius": 0.03},
-    # Bot Lane
-    {"name": "Blue Bot T1 Tower", "coords": (0.72, 0.91), "radius": 0.035},
-    {"name": "Blue Bot T2 Tower", "coords": (0.53, 0.81), "radius": 0.04},
-    {"name": "Blue Bot T3 Tower", "coords": (0.35, 0.86), "radius": 0.04},
-    {"name": "Blue Bot Inhibitor", "coords": (0.28, 0.9), "radius": 0.03},
-    # Nexus
-    {"name": "Blue Nexus Turret (Top)", "coords": (0.1, 0.85), "radius": 0.03},
-    {"name": "Blue Nexus Turret (Bottom)", "coords": (0.15, 0.9), "radius": 0.03},
-    {"name": "Blue Nexus", "coords": (0.07, 0.93), "radius": 0.04},
-
-    #Red Team
-    # Top Lane
-    {"name": "Red Top T1 Tower", "coords": (0.28, 0.09), "radius": 0.035},
-    {"name": "Red Top T2 Tower", "coords": (0.47, 0.19), "radius": 0.04},
-    {"name": "Red Top T3 Tower", "coords": (0.64, 0.16), "radius": 0.04},
-    {"name": "Red Top Inhibitor", "coords": (0.72, 0.1), "radius": 0.03},
-    # Mid Lane
-    {"name": "Red Mid T1 Tower", "coords": (0.60, 0.40), "radius": 0.04},
-    {"name": "Red Mid T2 Tower", "coords": (0.68, 0.32), "radius": 0.04},
-    {"name": "Red Mid T3 Tower", "coords": (0.76, 0.24), "radius": 0.04},
-    {"name": "Red Mid Inhibitor", "coords": (0.83, 0.19), "radius": 0.03},
-    # Bot Lane
-    {"name": "Red Bot T1 Tower", "coords": (0.91, 0.72), "radius": 0.035},
-    {"name": "Red Bot T2 Tower", "coords": (0.81, 0.53), "radius": 0.04},
-    {"name": "Red Bot T3 Tower", "coords": (0.86, 0.35), "radius": 0.04},
-    {"name": "Red Bot Inhibitor", "coords": (0.9, 0.28), "radius": 0.03},
-    # Nexus
-    {"name": "Red Nexus Turret (Top)", "coords": (0.85, 0.1), "radius": 0.03},
-    {"name": "Red Nexus Turret (Bottom)", "coords": (0.9, 0.15), "radius": 0.03},
-    {"name": "Red Nexus", "coords": (0.93, 0.07), "radius": 0.04},
-]
+from detector import MinimapDetector, EMPTY_DETECTIONS
+from tracker import PositionTracker, zone_lane_ids
+from gamestore import GameStore
+from heatmap import OccupancyMap
+from fog import FogEstimator, FOG_HORIZON_TICKS
+from zones import ZONE_DEFINITIONS
 
 MINIMAP_SCALE = 0.25
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -72,30 +22,62 @@ logging.getLogger("ultralytics").setLevel(logging.ERROR)
 load_dotenv()
 POLL_START_INTERVAL = int(os.getenv("POLL_START_INTERVAL", 5))
 POLL_GAME_INTERVAL = int(os.getenv("POLL_GAME_INTERVAL", 10))
+SNAPSHOT_SERVER_URL = "http://127.0.0.1:8000/receive_snapshot"
+
+ZONE_NAMES = [zone["name"] for zone in ZONE_DEFINITIONS]
+ZONE_COORDS = np.array([zone["coords"] for zone in ZONE_DEFINITIONS])
+ZONE_RADII = np.array([zone["radius"] for zone in ZONE_DEFINITIONS])
+ZONE_LANES = zone_lane_ids(ZONE_NAMES)
+
+def get_zone_indices(xs, ys):
+    """
+    Returns (zone_ids, inside) for arrays of normalized coordinates.
+    A point inside several zones gets the first one in ZONE_DEFINITIONS; a point
+    inside none gets the nearest zone with inside=False.
+    """
+    dist = np.hypot(np.asarray(xs)[:, None] - ZONE_COORDS[:, 0], np.asarray(ys)[:, None] - ZONE_COORDS[:, 1])
+    in_zone = dist <= ZONE_RADII
+    inside = in_zone.any(axis=1)
+    zone_ids = np.where(inside, np.argmax(in_zone, axis=1), np.argmin(dist, axis=1))
+    return zone_ids, inside
+
+def zone_label(zone_id, inside):
+    return ZONE_NAMES[zone_id] if inside else f"near {ZONE_NAMES[zone_id]}"
 
 def get_location(x_norm, y_norm):
     """
     Finds the name of the zone containing the given coordinates.
     If no exact zone contains the coordinates, it finds the nearest zone.
     """
-    for zone in ZONE_DEFINITIONS:
-        dist = np.sqrt((x_norm - zone["coords"][0]) ** 2 + (y_norm - zone["coords"][1]) ** 2)
-        if dist <= zone["radius"]:
-            return zone["name"]
-
-    min_distance = float('inf')
-    closest_zone_name = None
+    zone_ids, inside = get_zone_indices([x_norm], [y_norm])
+    return zone_label(zone_ids[0], inside[0])
 
-    for zone in ZONE_DEFINITIONS:
-        dist = np.sqrt((x_norm - zone["coords"][0]) ** 2 + (y_norm - zone["coords"][1]) ** 2)
-        if dist < min_distance:
-            min_distance = dist
-            closest_zone_name = zone["name"]
-
-    if closest_zone_name:
-        return f"near {closest_zone_name}"
-
-    return "Unknown Area"
+def build_class_slot_table(class_names, champion_name_map, all_players):
+    """
+    Maps every detector class ID to the index of the player in `all_players` playing
+    that champion, or -1. Built once per game so detections are resolved with one take().
+    """
+    player_slots = {p.get('championName'): i for i, p in enumerate(all_players) if p.get('championName')}
+    table = np.full(max(class_names) + 1, -1, dtype=np.intp)
+    for class_id, tag in class_names.items():
+        champion_name = champion_name_map.get(tag.lower())
+        if champion_name and champion_name in player_slots:
+            table[class_id] = player_slots[champion_name]
+    return table
+
+def select_champion_sightings(detections, class_slots):
+    """
+    Resolves detections to player slots and keeps the most confident detection per slot.
+    Returns (slots, xs, ys).
+    """
+    slots = class_slots[detections["class_id"]]
+    known = slots >= 0
+    slots, conf = slots[known], detections["conf"][known]
+    xs, ys = detections["x"][known], detections["y"][known]
+    order = np.argsort(-conf, kind="stable")
+    _, first = np.unique(slots[order], return_index=True)
+    best = order[first]
+    return slots[best], xs[best], ys[best]
 
 
 def get_full_game_data(base_url):
@@ -184,6 +166,14 @@ def prepare_log_entry(data, minimap_objects, active_player_name, inferred_positi
     }
     return clean_data
 
+def publish_snapshot(log_entry):
+    def post():
+        try:
+            requests.post(SNAPSHOT_SERVER_URL, json={"log_entry": log_entry}, timeout=1)
+        except requests.exceptions.RequestException:
+            pass
+    Thread(target=post, daemon=True).start()
+
 def monitor(base_url, detector, champion_name_map):
     print("▶ Game in progress... Starting data collection.")
     log_path = Path("game_log.json")
@@ -224,11 +214,16 @@ def monitor(base_url, detector, champion_name_map):
 
     position_tracker = PositionTracker()
     notifier = GameEventNotifier(main_player_info)
-    champion_last_positions = {}
+    fog_estimator = FogEstimator(ZONE_DEFINITIONS, horizon=FOG_HORIZON_TICKS * POLL_GAME_INTERVAL)
+    recorder = None
+    occupancy = None
+    last_frame_version = 0
 
     try:
         while detector.running:
+            request_time = time.monotonic()
             data = get_full_game_data(base_url)
+            snapshot_time = (request_time + time.monotonic()) / 2
             game_events = get_events(base_url)
 
             current_champion_names = {p['championName'] for p in data.get('allPlayers', []) if p.get('championName')}
@@ -236,30 +231,55 @@ def monitor(base_url, detector, champion_name_map):
                 time.sleep(POLL_GAME_INTERVAL)
                 continue
 
-            raw_detections = detector.get_detected_objects()
-            visible_champions = {}
-            for obj in raw_detections:
-                champion_id = obj['tag'].lower()
-                champion_name = champion_name_map.get(champion_id)
-                if champion_name and champion_name in current_champion_names:
-                    location = get_location(obj['x_norm'], obj['y_norm'])
-                    visible_champions[champion_name] = location
-                    champion_last_positions[champion_name] = location
-
-            position_tracker.update_sighting_counts(data.get('allPlayers', []), visible_champions)
-            position_tracker.infer_and_assign_roles(data.get('allPlayers', []))
+            all_players = data.get('allPlayers', [])
+            if recorder is None:
+                # Per-game lookup tables and per-player state, indexed by the player's slot in allPlayers.
+                champion_names = [p.get('championName') for p in all_players]
+                class_slots = build_class_slot_table(detector.model.names, champion_name_map, all_players)
+                last_x = np.zeros(len(all_players))
+                last_y = np.zeros(len(all_players))
+                last_seen_time = np.full(len(all_players), np.nan)
+                last_zone = np.full(len(all_players), -1, dtype=np.intp)
+                last_inside = np.zeros(len(all_players), dtype=bool)
+                recorder = GameStore().recorder(all_players, ZONE_NAMES, data.get("gameData", {}).get("gameTime", 0))
+                occupancy = OccupancyMap.restore(recorder.game_dir / "occupancy.npz", champion_names, ZONE_DEFINITIONS)
+
+            frame = detector.frames.nearest(snapshot_time)
+            if frame is None or frame.version <= last_frame_version:
+                frame = detector.frames.wait_newer(last_frame_version, timeout=1.0)
+            # A frame that was already consumed carries no new sightings.
+            detections = frame.detections if frame else EMPTY_DETECTIONS
+            if frame:
+                last_frame_version = frame.version
+                print(f"  - Minimap frame #{frame.version} ({snapshot_time - frame.capture_time:+.2f}s from API snapshot)")
+            slots, xs, ys = select_champion_sightings(detections, class_slots)
+            zone_ids, inside = get_zone_indices(xs, ys)
+            game_time = data.get("gameData", {}).get("gameTime", 0)
+            visible = np.zeros(len(champion_names), dtype=bool)
+            visible[slots] = True
+            last_x[slots], last_y[slots], last_seen_time[slots] = xs, ys, game_time
+            last_zone[slots], last_inside[slots] = zone_ids, inside
+
+            position_tracker.update_sighting_counts(all_players, slots, ZONE_LANES[zone_ids])
+            position_tracker.infer_and_assign_roles(all_players)
             inferred_positions = position_tracker.get_positions()
 
             final_minimap_objects = []
-            for name in sorted(list(current_champion_names)):
-                if name in visible_champions:
-                    final_minimap_objects.append({"champion": name, "location": visible_champions[name]})
-                elif name in champion_last_positions:
-                    final_minimap_objects.append({"champion": name, "location": f"last seen {champion_last_positions[name]}"})
+            for slot in sorted((i for i, name in enumerate(champion_names) if name), key=lambda i: champion_names[i]):
+                if visible[slot]:
+                    location = zone_label(last_zone[slot], last_inside[slot])
+                elif last_zone[slot] >= 0:
+                    location = f"last seen {zone_label(last_zone[slot], last_inside[slot])}"
                 else:
-                    final_minimap_objects.append({"champion": name, "location": "Unknown"})
+                    location = "Unknown"
+                final_minimap_objects.append({"champion": champion_names[slot], "location": location})
 
             log_entry = prepare_log_entry(data, final_minimap_objects, active_player_name, inferred_positions)
+            occupancy.update(game_time, slots, xs, ys)
+            log_entry["recentPresence"] = occupancy.summaries()
+            unseen = np.flatnonzero(~visible & ~np.isnan(last_seen_time))
+            log_entry["fogEstimates"] = fog_estimator.estimate([champion_names[i] for i in unseen], last_x[unseen],
+                                                               last_y[unseen], last_seen_time[unseen], game_time)
 
             elapsed = int(log_entry["gameTime"])
             timestamp = f"{elapsed // 60:02d}:{elapsed % 60:02d}"
@@ -276,6 +296,12 @@ def monitor(base_url, detector, champion_name_map):
             except Exception as e:
                 print(f"  - [Error] Failed to save file: {e}")
 
+            try:
+                recorder.record_tick(log_entry, slots, xs, ys, zone_ids)
+            except Exception as e:
+                print(f"  - [Error] Failed to record tick to game store: {e}")
+
+            publish_snapshot(log_entry)
             notifier.check_for_new_events(log_entry, game_events)
 
             time.sleep(POLL_GAME_INTERVAL)
@@ -286,6 +312,12 @@ def monitor(base_url, detector, champion_name_map):
         import traceback
         print(f"A critical error occurred during monitoring: {e}")
         traceback.print_exc()
+    finally:
+        if occupancy is not None:
+            try:
+                occupancy.save(recorder.game_dir / "occupancy.npz")
+            except Exception as e:
+                print(f"[Error] Failed to save occupancy snapshot: {e}")
 
 def await_game_start():
     print("▶ Waiting for League of Legends game to start...")
@@ -1,33 +1,67 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from pydantic import BaseModel
 import uvicorn
 from dotenv import load_dotenv
 from elevenlabs.client import ElevenLabs
 from elevenlabs import play
 import os
+import asyncio
+from stream import SnapshotHub, index_snapshot, SUBSCRIBER_SEND_TIMEOUT
 
 app = FastAPI()
 load_dotenv()
+snapshot_hub = SnapshotHub()
 
 elevenlabs = ElevenLabs(api_key=os.getenv("ELEVENLABS_API_KEY"),)
 
 class LLMAnalysis(BaseModel):
     analysis_text: str
 
+class GameSnapshot(BaseModel):
+    log_entry: dict
+
 async def tts(analysis_data: LLMAnalysis):
-    audio = elevenlabs.text_to_speech.convert(
+    # Both calls block until the audio is synthesized/played, so keep them off the event loop
+    # to let the snapshot stream keep running meanwhile.
+    audio = await asyncio.to_thread(
+        elevenlabs.text_to_speech.convert,
         text=analysis_data.analysis_text,
         voice_id="uyVNoMrnUku1dZyVEXwD",
         model_id="eleven_multilingual_v2",
         output_format="mp3_44100_128",
     )
-    play(audio)
+    await asyncio.to_thread(play, audio)
 
 @app.post("/receive_llm_analysis")
 async def receive_llm_analysis(analysis_data: LLMAnalysis):
+    snapshot_hub.publish("advice", analysis_data.analysis_text)
     await tts(analysis_data)
     print("\n--- 새로운 LLM 분석 결과 수신 ---")
     print(analysis_data.analysis_text)
     print("--------------------------------\n")
 
-    return {"status": "success", "message": "Analysis received"}
\ No newline at end of file
+    return {"status": "success", "message": "Analysis received"}
+
+@app.post("/receive_snapshot")
+async def receive_snapshot(snapshot: GameSnapshot):
+    snapshot_hub.publish("snapshot", index_snapshot(snapshot.log_entry))
+    return {"status": "success", "seq": snapshot_hub.seq}
+
+@app.websocket("/ws/snapshots")
+async def stream_snapshots(websocket: WebSocket):
+    await websocket.accept()
+    queue = snapshot_hub.subscribe()
+    try:
+        while True:
+            message = await queue.get()
+            if message is None:
+                await websocket.close(code=1013)
+                break
+            await asyncio.wait_for(websocket.send_text(message), timeout=SUBSCRIBER_SEND_TIMEOUT)
+    except asyncio.TimeoutError:
+        # The socket is stalled, so no close handshake; returning lets the server drop the connection.
+        print("[Stream] Dropping stalled subscriber.")
+    except WebSocketDisconnect:
+        pass
+    finally:
+        snapshot_hub.unsubscribe(queue)
@@ -4,10 +4,13 @@ import requests
 import google.generativeai as genai
 from dotenv import load_dotenv
 from threading import Thread, Timer
+from tracker import has_smite
 
 load_dotenv()
 
 FASTAPI_SERVER_URL = "http://127.0.0.1:8000/receive_llm_analysis"
+FOG_WARNING_ZONES = {"Baron Pit", "Dragon Pit"}
+FOG_WARNING_PROBABILITY = 0.3
 
 # structire code mapping
 STRUCTURE_ID_TO_NAME = {
@@ -62,6 +65,7 @@ class GameEventNotifier:
         self.main_player_info = main_player_info
         self.previous_state = {}
         self.last_event_id = -1
+        self.active_fog_warnings = set()
         self.event_buffer = []
         self.event_timer: Timer = None
         self.EVENT_TIMER_DURATION = 5.0  # seconds
@@ -86,6 +90,8 @@ class GameEventNotifier:
         new_events_found.extend(system_events)
         player_events = self._check_player_events(current_state)
         new_events_found.extend(player_events)
+        fog_events = self._check_fog_warnings(current_state)
+        new_events_found.extend(fog_events)
 
         if new_events_found:
             self.event_buffer.extend(new_events_found)
@@ -154,6 +160,26 @@ class GameEventNotifier:
                     continue
         return new_events
 
+    def _check_fog_warnings(self, current_state):
+        new_events = []
+        fog_estimates = current_state.get('fogEstimates', {})
+        current_warnings = set()
+        for player in current_state.get('players', []):
+            spells = player.get('spells', {})
+            if player.get('team') == self.main_player_info['team'] or not has_smite([spells.get('spell1'), spells.get('spell2')]):
+                continue
+            champion_name = player.get('championName')
+            for zone, probability in fog_estimates.get(champion_name, {}).items():
+                if zone in FOG_WARNING_ZONES and probability >= FOG_WARNING_PROBABILITY:
+                    current_warnings.add((champion_name, zone))
+                    if (champion_name, zone) not in self.active_fog_warnings:
+                        event_message = (f"Fog Warning: enemy jungler {champion_name} could be at {zone} "
+                                         f"({probability * 100:.0f}%).")
+                        print(f"[Fog Warning Detected] {event_message}")
+                        new_events.append(event_message)
+        self.active_fog_warnings = current_warnings
+        return new_events
+
     def _create_team_context(self, state, inferred_positions):
         team_context = {"ORDER": [], "CHAOS": []}
         position_order = {"TOP": 0, "JUNGLE": 1, "MID": 2, "BOT": 3, "UTILITY": 4, "UNKNOWN": 5}
@@ -185,6 +211,9 @@ class GameEventNotifier:
 
         Analyze the complete real-time game data provided below. Based on this data and the most recent events, give me one single, concise, and crucial piece of advice for what I, as '{self.main_player_info['championName']}', should focus on right now to maximize our chances of winning.
 
+        'recentPresence' lists the zones where each champion was seen over the last few minutes, with the share of sightings per zone. Use it to reason about jungle pathing and lane presence.
+        'fogEstimates' lists, for champions that left vision recently, the zones they could have reached since they were last seen, with a rough likelihood for each. Champions missing from it have been out of vision too long to estimate.
+
         Your advice must be a single sentence. Be direct and actionable.
         
         Always give advice with Korean.
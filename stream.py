@@ -0,0 +1,92 @@
+import asyncio
+import json
+
+SUBSCRIBER_QUEUE_SIZE = 8
+SUBSCRIBER_SEND_TIMEOUT = 5.0  # seconds
+
+
+def diff_state(previous, current, path=()):
+    """
+    Returns (changed, removed) turning `previous` into `current`.
+    `changed` holds every new or changed key, with nested dicts diffed recursively and any
+    other value (including lists) replaced as a whole. `removed` lists the key paths that
+    were deleted. Removals are kept separate so that a value of None is sent as a value,
+    unlike a JSON merge patch where null means "delete".
+    Clients deep-merge `changed` (dict into dict, anything else replaces) and then drop
+    every path in `removed`.
+    """
+    changed = {}
+    removed = []
+    for key, value in current.items():
+        old_value = previous.get(key)
+        if key not in previous:
+            changed[key] = value
+        elif isinstance(value, dict) and isinstance(old_value, dict):
+            sub_changed, sub_removed = diff_state(old_value, value, path + (key,))
+            if sub_changed:
+                changed[key] = sub_changed
+            removed.extend(sub_removed)
+        elif value != old_value:
+            changed[key] = value
+    for key in previous:
+        if key not in current:
+            removed.append(list(path + (key,)))
+    return changed, removed
+
+
+def index_snapshot(log_entry):
+    """
+    Re-keys the list fields of a `prepare_log_entry` snapshot by player/champion
+    so that deltas only carry the entries that actually changed.
+    """
+    indexed = dict(log_entry)
+    indexed["players"] = {p.get("summonerName"): p for p in log_entry.get("players", [])}
+    indexed["detectedMinimapObjects"] = {obj.get("champion"): obj.get("location")
+                                         for obj in log_entry.get("detectedMinimapObjects", [])}
+    return indexed
+
+
+class SnapshotHub:
+    """
+    Fan-out of analyzer snapshots to WebSocket subscribers.
+    Each published update is diffed and serialized once, then handed to every
+    subscriber queue without awaiting. A subscriber whose queue is full is dropped
+    instead of slowing down the publisher.
+    """
+    def __init__(self, queue_size=SUBSCRIBER_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self.state = {}
+        self.seq = 0
+        self.subscribers = set()
+
+    def subscribe(self):
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        queue.put_nowait(json.dumps({"type": "full", "seq": self.seq, "data": self.state}, ensure_ascii=False))
+        self.subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue):
+        self.subscribers.discard(queue)
+
+    def publish(self, key, value):
+        new_state = dict(self.state)
+        new_state[key] = value
+        changed, removed = diff_state(self.state, new_state)
+        if not changed and not removed:
+            return
+        self.state = new_state
+        self.seq += 1
+        if not self.subscribers:
+            return
+        message = json.dumps({"type": "delta", "seq": self.seq, "data": changed, "removed": removed},
+                             ensure_ascii=False)
+        for queue in list(self.subscribers):
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                print("[Stream] Dropping slow subscriber.")
+                self.subscribers.discard(queue)
+                # Discard the stale backlog and wake the sender so it closes right away.
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(None)
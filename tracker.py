@@ -1,10 +1,32 @@
 import itertools
+import numpy as np
+
+LANES = ['TOP', 'MID', 'BOT']
+
+
+def zone_lane_ids(zone_names):
+    """Maps each zone name to an index into LANES, or -1 for zones outside the lanes."""
+    lane_ids = np.full(len(zone_names), -1, dtype=np.intp)
+    for i, name in enumerate(zone_names):
+        name_lower = name.lower()
+        if 'top' in name_lower or '탑' in name_lower:
+            lane_ids[i] = 0
+        elif 'mid' in name_lower or '미드' in name_lower:
+            lane_ids[i] = 1
+        elif 'bot' in name_lower or '봇' in name_lower:
+            lane_ids[i] = 2
+    return lane_ids
+
+
+def has_smite(spell_names):
+    return any('강타' in name or 'smite' in name.lower() for name in spell_names if name)
 
 
 class PositionTracker:
     def __init__(self):
         self.champion_positions = {}
-        self.position_counters = {}
+        self.summoner_slots = {}
+        self.lane_counts = np.zeros((0, len(LANES)), dtype=np.int64)
         self.SUPPORT_ITEM_IDS = {
             3865,  # 세계의 아틀라스
             3002,
@@ -12,29 +34,17 @@ class PositionTracker:
             4641,
         }
 
-    def update_sighting_counts(self, all_players, visible_champions):
-        for player in all_players:
-            summoner_name = player.get('summonerName')
-            if summoner_name and summoner_name not in self.position_counters:
-                self.position_counters[summoner_name] = {'TOP': 0, 'MID': 0, 'BOT': 0}
-
-        for champion_name, location in visible_champions.items():
-            summoner_name = None
-            for player in all_players:
-                if player.get('championName') == champion_name:
-                    summoner_name = player.get('summonerName')
-                    break
-
-            if not summoner_name:
-                continue
-
-            loc_lower = location.lower()
-            if 'top' in loc_lower or '탑' in loc_lower:
-                self.position_counters[summoner_name]['TOP'] += 1
-            elif 'mid' in loc_lower or '미드' in loc_lower:
-                self.position_counters[summoner_name]['MID'] += 1
-            elif 'bot' in loc_lower or '봇' in loc_lower:
-                self.position_counters[summoner_name]['BOT'] += 1
+    def update_sighting_counts(self, all_players, player_slots, lane_ids):
+        """
+        `player_slots` are indices into `all_players` of the visible champions and
+        `lane_ids` their lane (index into LANES, -1 when not in a lane).
+        """
+        if len(all_players) > len(self.lane_counts):
+            self.lane_counts = np.pad(self.lane_counts, ((0, len(all_players) - len(self.lane_counts)), (0, 0)))
+        self.summoner_slots = {p.get('summonerName'): i for i, p in enumerate(all_players) if p.get('summonerName')}
+
+        in_lane = lane_ids >= 0
+        np.add.at(self.lane_counts, (player_slots[in_lane], lane_ids[in_lane]), 1)
 
     def infer_and_assign_roles(self, all_players):
         teams = {'ORDER': [], 'CHAOS': []}
@@ -54,10 +64,12 @@ class PositionTracker:
                 summoner_name = p.get('summonerName')
                 if not summoner_name: continue
 
-                spells = p.get('spells', {})
+                spells = p.get('summonerSpells', {})
+                spell_names = [spells.get('summonerSpellOne', {}).get('displayName'),
+                               spells.get('summonerSpellTwo', {}).get('displayName')]
                 items = p.get('items', [])
 
-                if '강타' in spells.get('spell1_name', '') or '강타' in spells.get('spell2_name', '') or 'smite' in spells.get('spell1_name', '') or 'smite' in spells.get('spell2_name', ''):
+                if has_smite(spell_names):
                     assigned_in_team[summoner_name] = 'JUNGLE'
 
                 #아이템 dict에서 비교
@@ -74,8 +86,10 @@ class PositionTracker:
                 best_player_for_lane = None
                 max_score = -1
 
+                lane_index = LANES.index(lane_to_assign)
                 for summoner_name in unassigned_in_team:
-                    score = self.position_counters.get(summoner_name, {}).get(lane_to_assign, 0)
+                    slot = self.summoner_slots.get(summoner_name)
+                    score = self.lane_counts[slot, lane_index] if slot is not None else 0
                     if score > max_score:
                         max_score = score
                         best_player_for_lane = summoner_name
@@ -0,0 +1,53 @@
+ZONE_DEFINITIONS = [
+    #Objects
+    {"name": "Baron Pit", "coords": (0.355, 0.245), "radius": 0.06},
+    {"name": "Dragon Pit", "coords": (0.645, 0.755), "radius": 0.06},
+
+    #Jungle
+    {"name": "Blue Team's Blue Buff", "coords": (0.185, 0.65), "radius": 0.045},
+    {"name": "Blue Team's Red Buff", "coords": (0.37, 0.81), "radius": 0.045},
+    {"name": "Red Team's Blue Buff", "coords": (0.815, 0.35), "radius": 0.045},
+    {"name": "Red Team's Red Buff", "coords": (0.63, 0.19), "radius": 0.045},
+
+    #Blue Team
+    # Top Lane
+    {"name": "Blue Top T1 Tower", "coords": (0.09, 0.28), "radius": 0.035},
+    {"name": "Blue Top T2 Tower", "coords": (0.19, 0.47), "radius": 0.04},
+    {"name": "Blue Top T3 Tower", "coords": (0.16, 0.64), "radius": 0.04},
+    {"name": "Blue Top Inhibitor", "coords": (0.1, 0.71), "radius": 0.03},
+    # Mid Lane
+    {"name": "Blue Mid T1 Tower", "coords": (0.40, 0.60), "radius": 0.04},
+    {"name": "Blue Mid T2 Tower", "coords": (0.32, 0.68), "radius": 0.04},
+    {"name": "Blue Mid T3 Tower", "coords": (0.24, 0.76), "radius": 0.04},
+    {"name": "Blue Mid Inhibitor", "coords": (0.17, 0.81), "radius": 0.03},
+    # Bot Lane
+    {"name": "Blue Bot T1 Tower", "coords": (0.72, 0.91), "radius": 0.035},
+    {"name": "Blue Bot T2 Tower", "coords": (0.53, 0.81), "radius": 0.04},
+    {"name": "Blue Bot T3 Tower", "coords": (0.35, 0.86), "radius": 0.04},
+    {"name": "Blue Bot Inhibitor", "coords": (0.28, 0.9), "radius": 0.03},
+    # Nexus
+    {"name": "Blue Nexus Turret (Top)", "coords": (0.1, 0.85), "radius": 0.03},
+    {"name": "Blue Nexus Turret (Bottom)", "coords": (0.15, 0.9), "radius": 0.03},
+    {"name": "Blue Nexus", "coords": (0.07, 0.93), "radius": 0.04},
+
+    #Red Team
+    # Top Lane
+    {"name": "Red Top T1 Tower", "coords": (0.28, 0.09), "radius": 0.035},
+    {"name": "Red Top T2 Tower", "coords": (0.47, 0.19), "radius": 0.04},
+    {"name": "Red Top T3 Tower", "coords": (0.64, 0.16), "radius": 0.04},
+    {"name": "Red Top Inhibitor", "coords": (0.72, 0.1), "radius": 0.03},
+    # Mid Lane
+    {"name": "Red Mid T1 Tower", "coords": (0.60, 0.40), "radius": 0.04},
+    {"name": "Red Mid T2 Tower", "coords": (0.68, 0.32), "radius": 0.04},
+    {"name": "Red Mid T3 Tower", "coords": (0.76, 0.24), "radius": 0.04},
+    {"name": "Red Mid Inhibitor", "coords": (0.83, 0.19), "radius": 0.03},
+    # Bot Lane
+    {"name": "Red Bot T1 Tower", "coords": (0.91, 0.72), "radius": 0.035},
+    {"name": "Red Bot T2 Tower", "coords": (0.81, 0.53), "radius": 0.04},
+    {"name": "Red Bot T3 Tower", "coords": (0.86, 0.35), "radius": 0.04},
+    {"name": "Red Bot Inhibitor", "coords": (0.9, 0.28), "radius": 0.03},
+    # Nexus
+    {"name": "Red Nexus Turret (Top)", "coords": (0.85, 0.1), "radius": 0.03},
+    {"name": "Red Nexus Turret (Bottom)", "coords": (0.9, 0.15), "radius": 0.03},
+    {"name": "Red Nexus", "coords": (0.93, 0.07), "radius": 0.04},
+]